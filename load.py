@@ -32,6 +32,7 @@ from .src.core import (  # noqa: F401, E402
     TreeSitterUpdateLanguageCommand,
     TreeSitterUpdateTreeCommand,
     on_load,
+    on_unload,
 )
 
 
@@ -40,3 +41,10 @@ def plugin_loaded():
     See docstring for `on_load`.
     """
     on_load()
+
+
+def plugin_unloaded():
+    """
+    See docstring for `on_unload`.
+    """
+    on_unload()
@@ -11,13 +11,15 @@ from .core import (
     BUFFER_ID_TO_TREE,
     SCOPE_TO_LANGUAGE,
     byte_offset,
+    cache_tree_dict,
     check_scope,
+    get_parser,
     get_scope,
     get_view_text,
     make_tree_dict,
     parse,
     publish_tree_update,
-    trim_cached_trees,
+    uncache_tree_dict,
 )
 from .utils import PROJECT_ROOT, get_queries_path, get_scope_to_language_name, log, maybe_none, not_none
 
@@ -45,16 +47,15 @@ def get_tree_dict(buffer_id: int):
     if not isinstance(cast(Any, buffer_id), int) or not (view := get_view_from_buffer_id(buffer_id)):
         return
     if not (scope := get_scope(view)) or not (scope := check_scope(scope)):
-        BUFFER_ID_TO_TREE.pop(buffer_id, None)
+        uncache_tree_dict(buffer_id)
         return
 
     tree_dict = BUFFER_ID_TO_TREE.get(buffer_id)
     if not tree_dict or tree_dict["scope"] != scope:
-        from tree_sitter import Parser
-
-        view_text = get_view_text(view)
-        BUFFER_ID_TO_TREE[buffer_id] = make_tree_dict(parse(Parser(), scope, view_text), view_text, scope)
-        trim_cached_trees()
+        view_text, change_count = get_view_text(view), view.change_count()
+        b = view_text.encode()
+        tree = parse(get_parser({}, scope), b)
+        cache_tree_dict(buffer_id, make_tree_dict(tree, view_text, scope), bytearray(b), change_count)
         publish_tree_update(view.window(), buffer_id=buffer_id, scope=scope)
 
     return BUFFER_ID_TO_TREE.get(buffer_id)
@@ -39,10 +39,14 @@ from __future__ import annotations
 import os
 import subprocess
 import time
+import traceback
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
 from pathlib import Path
 from shutil import rmtree
-from threading import Thread
-from typing import TYPE_CHECKING, TypedDict, cast
+from threading import Lock
+from typing import TYPE_CHECKING, Callable, TypedDict, cast
 
 import sublime
 import sublime_plugin
@@ -64,6 +68,7 @@ from .utils import (
     get_scope_to_language_name,
     get_settings,
     get_settings_dict,
+    invalidate_settings_cache,
     log,
 )
 
@@ -74,15 +79,35 @@ PROJECT_REPO = "https://github.com/sublime-treesitter/TreeSitter"
 
 MAX_CACHED_TREES = 16
 SCOPE_TO_LANGUAGE: dict[ScopeType, Language] = {}
+# Copies of `SCOPE_TO_LANGUAGE` keys for `check_scope`, a set for exact matches and a tuple that keeps their order for
+# prefix matches, see `refresh_active_scopes`
+ACTIVE_SCOPES: frozenset[ScopeType] = frozenset()
+ACTIVE_SCOPES_ORDERED: tuple[ScopeType, ...] = ()
 
-# LRU cache, dict of `(buffer_id, syntax)` tuple keys pointing to dict with tree instance and other metadata.
-BUFFER_ID_TO_TREE: dict[int, TreeDict] = {}
+# A single persistent worker, so parses run off ST's async callback thread, but still one at a time and in FIFO order
+PARSE_POOL = ThreadPoolExecutor(max_workers=1, thread_name_prefix="ts-parse")
+
+# A single persistent worker for installing, building, and removing languages, so these jobs run one at a time
+MAINTENANCE_POOL = ThreadPoolExecutor(max_workers=1, thread_name_prefix="ts-maint")
+
+# LRU cache, `buffer_id` keys pointing to dict with tree instance and other metadata. Most recently used key is last.
+BUFFER_ID_TO_TREE: OrderedDict[int, TreeDict] = OrderedDict()
+
+# Source each cached tree was parsed from, i.e. its `s` encoded as UTF-8, paired with the tree dict it belongs to and
+# the buffer's change count at the time. This is internal, and edited in place, so it's kept out of `TreeDict`, see
+# `get_tree_source`
+BUFFER_ID_TO_SOURCE: dict[int, tuple[TreeDict, bytearray, int]] = {}
 
 # These need to be added to plugin host's `sys.path` before other plugins that depend on them load
 add_path(str(LIB_PATH))
 
 
 class TreeDict(TypedDict):
+    """
+    Public, returned to client code by `get_tree_dict`, which reads it with subscripts. At runtime it's a plain dict, so
+    constructing one per edit is a single small allocation, and `TypedDict` adds no overhead.
+    """
+
     tree: Tree
     s: str
     scope: ScopeType
@@ -100,20 +125,29 @@ class MutableSettings(TypedDict):
 mutable_settings = MutableSettings(settings=None)
 
 
-def on_update_python_path():
+def on_settings_change():
     """
-    Reinstantiate languages in case `python_path` setting updated.
+    Invalidate cached settings, and reinstantiate languages in case `python_path` setting updated.
 
     If there's an easier way to check whether plugin settings have changed I'd love to know what it is!
     """
+    invalidate_settings_cache()
     settings_dict = get_settings_dict()
     if previous_settings_dict := mutable_settings["settings"]:
         if previous_settings_dict.get("python_path") != settings_dict.get("python_path"):
             instantiate_languages()
-            Thread(target=install_languages).start()
+            submit(MAINTENANCE_POOL, install_languages)
     mutable_settings["settings"] = settings_dict
 
 
+def on_unload():
+    """
+    Called in `plugin_unloaded` in `load.py`. Lets workers exit instead of leaking them across plugin reloads.
+    """
+    PARSE_POOL.shutdown(wait=False)
+    MAINTENANCE_POOL.shutdown(wait=False)
+
+
 def on_load():
     """
     Called in `plugin_loaded` in `load.py`. Called after plugin is loaded (we can use functions like
@@ -129,9 +163,10 @@ def on_load():
         pass
 
     settings = get_settings()
-    mutable_settings["settings"] = get_settings_dict(settings)
+    invalidate_settings_cache()
+    mutable_settings["settings"] = get_settings_dict()
     settings.clear_on_change("TreeSitter")
-    settings.add_on_change("TreeSitter", on_update_python_path)
+    settings.add_on_change("TreeSitter", on_settings_change)
 
     if not get_settings_dict().get("python_path"):
         log("`python_path` not set, using language binaries bundled with tree_sitter_languages")
@@ -139,7 +174,7 @@ def on_load():
         log(f'`python_path` set, language repos and .so files installed at "{BUILD_PATH}"')
 
     instantiate_languages()
-    Thread(target=install_languages).start()
+    submit(MAINTENANCE_POOL, install_languages)
 
 
 def clone_language(org_and_repo: str, branch: str = ""):
@@ -154,13 +189,21 @@ def clone_language(org_and_repo: str, branch: str = ""):
         subprocess.run(["git", "checkout", branch], cwd=repo_path, check=True)
 
 
+@lru_cache(maxsize=64)
 def get_so_file(language_name: str):
     return f"language-{language_name}.so"
 
 
-def clone_languages():
+def get_build_path_files() -> set[str]:
+    return {entry.name for entry in os.scandir(BUILD_PATH)}
+
+
+def clone_languages(names: set[str], files: set[str]):
     """
-    Clone language repos from which language `.so` files can be built.
+    Clone repos for languages in `names` from which language `.so` files can be built. `files` are the names of files
+    in `BUILD_PATH`, and cloned repos are added to it.
+
+    Cloning is network bound, so repos are cloned concurrently.
 
     This function is NOOP if `python_path` not set.
     """
@@ -169,34 +212,60 @@ def clone_languages():
         # Rely instead on language binaries bundled with tree_sitter_languages
         return
 
-    language_names = settings_dict["installed_languages"]
-    files = set(f for f in os.listdir(BUILD_PATH))
     language_name_to_repo = get_language_name_to_repo()
+    repo_to_clone_args: dict[str, tuple[str, str]] = {}
 
-    for name in set(language_names):
+    for name in names:
         if name not in language_name_to_repo:
             log(f'"{name}" language is not supported, read more at {PROJECT_REPO}')
             continue
 
-        repo_dict = language_name_to_repo[name]
-        org_and_repo = repo_dict["repo"]
+        repo_entry = language_name_to_repo[name]
+        org_and_repo = repo_entry.repo
         _, repo = org_and_repo.split("/")
-        if repo in files:
-            # We've already cloned this repo
+        if repo in files or repo in repo_to_clone_args:
+            # We've already cloned this repo, or we're about to; avoid cloning a repo used for multiple languages twice
             continue
 
         log_s = f"installing {org_and_repo} repo for {name} language"
-        if branch := repo_dict.get("branch", ""):
+        if branch := repo_entry.branch:
             log_s = f"{log_s}, and checking out {branch}"
         log(log_s, with_status=True)
-        clone_language(org_and_repo, branch=repo_dict.get("branch", ""))
-        files.add(repo)  # Avoid cloning a repo used for multiple languages multiple times
+        repo_to_clone_args[repo] = (org_and_repo, branch)
+
+    if not repo_to_clone_args:
+        return
 
+    with ThreadPoolExecutor(max_workers=8, thread_name_prefix="ts-clone") as executor:
+        # Consume results so exceptions raised in `clone_language` are re-raised here
+        list(executor.map(lambda args: clone_language(*args), repo_to_clone_args.values()))
+    files.update(repo_to_clone_args)
 
-def build_languages():
+
+def build_language(python_path: str, pip_path: str, path: str, so_file: str):
+    """
+    Build language `.so` file from parser files at `path`, by running `build.py` with external python executable.
+    """
+    subprocess.run(
+        [
+            os.path.expanduser(python_path),
+            str(BUILD_PY_PATH),
+            os.path.expanduser(pip_path),
+            str(BUILD_PATH / path),
+            str(BUILD_PATH / so_file),
+        ],
+        check=True,
+    )
+
+
+def build_languages(names: set[str], files: set[str]):
     """
-    Build missing language `.so` files for installed languages. We use python 3.8 executable to build languages, because
-    the python bundled with Sublime can't do this.
+    Build missing language `.so` files for languages in `names`. We use python 3.8 executable to build languages,
+    because the python bundled with Sublime can't do this. Built `.so` files are added to `files`.
+
+    Builds are CPU bound and independent, so they run in concurrent subprocesses. The first build runs on its own,
+    because `build.py` might `pip install` the bindings, and concurrent installs into the same env could clobber each
+    other.
 
     This function is NOOP if `python_path` not set, in which case we rely on bundled `tree_sitter_languages`.
 
@@ -207,17 +276,15 @@ def build_languages():
         # Rely instead on language binaries bundled with tree_sitter_languages
         return
 
-    language_names = settings_dict["installed_languages"]
-
     pip_path = settings_dict.get("pip_path")
     if not pip_path:
         head, _ = os.path.split(python_path)
         pip_path = str(Path(head) / "pip")
 
-    files = set(f for f in os.listdir(BUILD_PATH))
     language_name_to_parser_path = get_language_name_to_parser_path()
+    build_args: list[tuple[str, str, str, str]] = []
 
-    for name in set(language_names):
+    for name in names:
         if (so_file := get_so_file(name)) in files:
             # We've already built this .so file
             continue
@@ -227,32 +294,38 @@ def build_languages():
 
         path = language_name_to_parser_path[name]
         log(f"building {name} language from files at {path}", with_status=True)
-        subprocess.run(
-            [
-                os.path.expanduser(python_path),
-                str(BUILD_PY_PATH),
-                os.path.expanduser(pip_path),
-                str(BUILD_PATH / path),
-                str(BUILD_PATH / so_file),
-            ],
-            check=True,
-        )
+        build_args.append((python_path, pip_path, path, so_file))
+
+    if not build_args:
+        return
+
+    build_language(*build_args[0])
+    files.add(build_args[0][-1])
 
+    with ThreadPoolExecutor(max_workers=os.cpu_count(), thread_name_prefix="ts-build") as executor:
+        # Consume results so exceptions raised in `build_language` are re-raised here
+        list(executor.map(lambda args: build_language(*args), build_args[1:]))
+    files.update(args[-1] for args in build_args[1:])
 
-def instantiate_languages():
+
+def instantiate_languages(names: set[str] | None = None, files: set[str] | None = None):
     """
     Instantiate `Language`s from language binaries, and put them in `SCOPE_TO_LANGUAGE`. This takes about 0.1ms for 2
     languages on my machine.
+
+    `names` defaults to installed languages. `files` are the names of files in `BUILD_PATH`. If not passed, and
+    `python_path` is set, we scan `BUILD_PATH`.
     """
     from tree_sitter import Language
     from tree_sitter_languages import get_language
 
     settings_dict = get_settings_dict()
     python_path = settings_dict.get("python_path")
-    language_names = settings_dict["installed_languages"]
+    if names is None:
+        names = set(settings_dict["installed_languages"])
     language_name_to_scopes = get_language_name_to_scopes()
 
-    for name in set(language_names):
+    for name in names:
         if name not in language_name_to_scopes:
             continue
 
@@ -262,7 +335,8 @@ def instantiate_languages():
 
         language: Language | None = None
         if python_path:
-            files = set(f for f in os.listdir(BUILD_PATH))
+            if files is None:
+                files = get_build_path_files()
             if (so_file := get_so_file(name)) not in files:
                 continue
 
@@ -277,6 +351,15 @@ def instantiate_languages():
         for scope in language_name_to_scopes[name]:
             SCOPE_TO_LANGUAGE[scope] = language
 
+    refresh_active_scopes()
+
+
+def refresh_active_scopes():
+    global ACTIVE_SCOPES, ACTIVE_SCOPES_ORDERED
+
+    ACTIVE_SCOPES_ORDERED = tuple(SCOPE_TO_LANGUAGE)
+    ACTIVE_SCOPES = frozenset(ACTIVE_SCOPES_ORDERED)
+
 
 #
 # Code for caching syntax trees by their `buffer_id`s, and keeping them in sync as `TextChange`s occur
@@ -294,11 +377,10 @@ def check_scope(scope: str | None):
     """
     if not scope:
         return None
-    if scope in SCOPE_TO_LANGUAGE:
+    if scope in ACTIVE_SCOPES:
         return scope
 
-    scopes = list(SCOPE_TO_LANGUAGE.keys())
-    for supported_scope in scopes:
+    for supported_scope in ACTIVE_SCOPES_ORDERED:
         if scope.startswith(f"{supported_scope}."):
             return supported_scope
 
@@ -325,6 +407,7 @@ def get_edit(
     change: sublime.TextChange,
     s: str,
     should_change_s: bool,
+    is_ascii: bool = False,
 ) -> tuple[tuple[int, int, int, tuple[int, int], tuple[int, int], tuple[int, int]], str]:
     """
     Args:
@@ -332,6 +415,7 @@ def get_edit(
     - `s`: Buffer text before text change was applied
     - `change`: TextChange
     - `should_change_s`: Should we change s? Not doing so for final TextChange in "group" is a performance optimization
+    - `is_ascii`: Is `s` ASCII? If so, byte offsets are the same as points, and we needn't encode `s` to compute them
 
     Returns:
 
@@ -369,7 +453,7 @@ def get_edit(
     changed_s = s
 
     # Initialize variables assuming neither insertion nor deletion
-    start_byte = byte_offset(change.a.pt, s)
+    start_byte = change.a.pt if is_ascii else byte_offset(change.a.pt, s)
     old_end_byte = start_byte
     new_end_byte = start_byte
 
@@ -400,39 +484,69 @@ def get_edit(
 
 def edit(
     parser: Parser,
-    scope: ScopeType,
     changes: list[sublime.TextChange],
     tree: Tree,
     s: str,
-    new_s: str,
+    buf: bytearray,
+    new_s: str | None = None,
     debug: bool = False,
-) -> Tree:
+) -> tuple[Tree, bytearray, str]:
     """
-    To get the new tree, do `new_tree = parser.parse(new_s, tree)`
+    Apply `changes` to `tree` with `Tree.edit`, then do an incremental parse, `new_tree = parser.parse(buf, tree)`.
+
+    `buf` is `s` encoded as UTF-8. Comparing their lengths tells us whether `s` is ASCII, in which case `get_edit`
+    doesn't need to encode `s` to compute byte offsets.
+
+    Changes are spliced into `buf` in place, so we only encode inserted text instead of all of `new_s`. If `new_s`
+    isn't passed, we decode it from `buf`, so callers needn't read view text. Returns new tree, `buf`, which is now
+    `new_s` encoded as UTF-8, and `new_s`.
 
     Note that Sublime serializes text changes s.t. that they can be applied as is and in order, even if text is replaced
     and/or there are multiple selections.
     """
-    parser.set_language(SCOPE_TO_LANGUAGE[scope])
-
     changed_s = s
+    is_ascii = len(buf) == len(s)
     for idx, change in enumerate(changes):
         should_change_s = debug or idx < len(changes) - 1  # Performance optimization, see `get_edit`
-        edit_tuple, changed_s = get_edit(change, changed_s, should_change_s)
+        edit_tuple, changed_s = get_edit(change, changed_s, should_change_s, is_ascii=is_ascii)
         tree.edit(*edit_tuple)
+        start_byte, old_end_byte, *_ = edit_tuple
+        buf[start_byte:old_end_byte] = change.str.encode()
+        is_ascii = is_ascii and change.str.isascii()
 
+    if new_s is None:
+        new_s = buf.decode()
     if debug:
-        # Applying changes to `s` must yield `new_s`
+        # Applying changes to `s` and `buf` must yield `new_s` and its encoding
         assert changed_s == new_s
-    return parser.parse(new_s.encode(), tree)
+        assert buf == new_s.encode()
+    return parser.parse(bytes(buf), tree), buf, new_s
 
 
-def parse(parser: Parser, scope: ScopeType, s: str) -> Tree:
+def parse(parser: Parser, s: str | bytes) -> Tree:
     """
-    Note: the `set_language` call costs nothing, I can call it 2 million times a second on 2021 M1 MPB with 16gb RAM.
+    `parser` must already be bound to a language, see `get_parser`.
     """
-    parser.set_language(SCOPE_TO_LANGUAGE[scope])
-    return parser.parse(s.encode())
+    return parser.parse(s.encode() if isinstance(s, str) else s)
+
+
+def get_parser(parsers: dict[ScopeType, tuple[Language, Parser]], scope: ScopeType) -> Parser:
+    """
+    Get parser for `scope` from `parsers`, creating it if necessary. Each parser is bound to one language, so we call
+    `set_language` once per scope instead of on every parse.
+
+    If the scope's language has been reinstantiated, e.g. because it was updated, we replace the parser.
+    """
+    from tree_sitter import Parser
+
+    language = SCOPE_TO_LANGUAGE[scope]
+    if (cached := parsers.get(scope)) and cached[0] is language:
+        return cached[1]
+
+    parser = Parser()
+    parser.set_language(language)
+    parsers[scope] = (language, parser)
+    return parser
 
 
 def make_tree_dict(tree: Tree, s: str, scope: ScopeType) -> TreeDict:
@@ -462,35 +576,117 @@ def publish_tree_update(window: sublime.Window | None, buffer_id: int, scope: st
     )
 
 
+def submit(pool: ThreadPoolExecutor, callback: Callable[[], object]):
+    """
+    Run `callback` on `pool`. Futures swallow exceptions, so we print them like ST does for async callbacks.
+
+    Jobs submitted after `on_unload` shut down the pool, e.g. by a listener of the old plugin instance during a reload,
+    are ignored.
+    """
+
+    def run():
+        try:
+            callback()
+        except Exception:
+            traceback.print_exc()
+
+    try:
+        pool.submit(run)
+    except RuntimeError:
+        pass
+
+
 def get_view_text(view: View):
     return view.substr(sublime.Region(0, view.size()))
 
 
 def trim_cached_trees(size: int = MAX_CACHED_TREES):
     """
-    Note that trimming an item is O(N) in `MAX_CACHED_TREES`.
+    Evict least recently used trees. Trees are written with `cache_tree_dict`, which puts the buffer id last, so the
+    oldest entry is always first, and trimming an item is O(1).
+
+    Eviction is lazy: we let the cache grow to twice `size`, then trim it back down to `size` in one batch. In most
+    sessions this means we never trim at all.
+    """
+    if len(BUFFER_ID_TO_TREE) <= 2 * size:
+        return
+
+    for _ in range(len(BUFFER_ID_TO_TREE) - size):
+        buffer_id, _ = BUFFER_ID_TO_TREE.popitem(last=False)
+        BUFFER_ID_TO_SOURCE.pop(buffer_id, None)
+
 
-    This is fast enough, and much easier than using heapq or similar to implement a sorted set.
+def cache_tree_dict(
+    buffer_id: int,
+    tree_dict: TreeDict,
+    source: bytearray | None = None,
+    change_count: int = -1,
+):
     """
-    while len(BUFFER_ID_TO_TREE) > MAX_CACHED_TREES:
-        _, buffer_id = min((d["updated_s"], buffer_id) for buffer_id, d in BUFFER_ID_TO_TREE.items())
-        BUFFER_ID_TO_TREE.pop(buffer_id, None)
+    Write `tree_dict` to `BUFFER_ID_TO_TREE` as its most recently used entry, then trim cached trees.
 
+    If passed, `source` is the UTF-8 encoded `s` the tree was parsed from, and `change_count` is the buffer's change
+    count when `s` was read. Together they let the next text change edit the tree, see `get_tree_source`.
 
-def parse_view(parser: Parser, view: View, view_text: str, publish_update: bool = True):
+    We pop and reinsert instead of assigning and calling `move_to_end`, because `on_close` can pop the same key between
+    the two calls, and `move_to_end` raises if the key is gone.
+    """
+    BUFFER_ID_TO_TREE.pop(buffer_id, None)
+    BUFFER_ID_TO_TREE[buffer_id] = tree_dict
+    if source is None:
+        BUFFER_ID_TO_SOURCE.pop(buffer_id, None)
+    else:
+        BUFFER_ID_TO_SOURCE[buffer_id] = (tree_dict, source, change_count)
+    trim_cached_trees()
+
+
+def uncache_tree_dict(buffer_id: int):
+    """
+    Stop tracking buffer, removing its tree and source.
+    """
+    BUFFER_ID_TO_TREE.pop(buffer_id, None)
+    BUFFER_ID_TO_SOURCE.pop(buffer_id, None)
+
+
+def get_tree_source(buffer_id: int, tree_dict: TreeDict, change_count: int | None) -> bytearray | None:
+    """
+    Get `tree_dict["s"]` encoded as UTF-8, if `tree_dict` can be edited with text changes made after the buffer's change
+    count was `change_count`. Else returns `None`, and the tree should be parsed from view text instead.
+
+    Source is only returned if it was cached with this very tree dict, and at this very change count. Trees can be
+    written without source, e.g. by `get_tree_dict`, and text changes can be skipped, e.g. if the buffer's syntax
+    changes for a while. Editing a tree that's missed a text change would leave it and its source permanently out of
+    sync with the buffer.
+    """
+    entry = BUFFER_ID_TO_SOURCE.get(buffer_id)
+    if not entry or entry[0] is not tree_dict or entry[2] != change_count:
+        return None
+    return entry[1]
+
+
+def parse_view(
+    parsers: dict[ScopeType, tuple[Language, Parser]],
+    view: View,
+    view_text: str,
+    change_count: int = -1,
+    publish_update: bool = True,
+):
     """
     Defined outside of `TreeSitterEventListener` so it can be called by anything, e.g. called on the active buffer after
     a new language is installed and loaded.
+
+    `change_count` is the buffer's change count when `view_text` was read. If it's not passed, the next text change does
+    a full parse instead of editing this tree.
     """
     scope = get_scope(view)
     if not (scope := check_scope(scope)):
         return
 
-    buffer_id = view.buffer().id()
-    tree = parse(parser, scope, s=view_text)
+    buffer_id = view.buffer_id()
+    b = view_text.encode()
+    tree = parse(get_parser(parsers, scope), s=b)
 
-    BUFFER_ID_TO_TREE[buffer_id] = make_tree_dict(tree, view_text, scope)
-    trim_cached_trees()
+    cache_tree_dict(buffer_id, make_tree_dict(tree, view_text, scope), bytearray(b), change_count)
 
     if publish_update:
         publish_tree_update(view.window(), buffer_id=buffer_id, scope=scope)
@@ -498,6 +694,18 @@ def parse_view(parser: Parser, view: View, view_text: str, publish_update: bool
     return tree
 
 
+def ensure_languages(names: set[str], files: set[str]):
+    """
+    Clone, build and instantiate languages in `names`, sharing one set of `BUILD_PATH` `files` between the steps.
+
+    Each step handles all languages at once, rather than running the steps language by language, so that clones and
+    builds can run concurrently.
+    """
+    clone_languages(names, files)
+    build_languages(names, files)
+    instantiate_languages(names, files)
+
+
 def install_languages():
     """
     - Clones language repos, and builds .so files on disk
@@ -507,14 +715,11 @@ def install_languages():
 
     Idempotent. Also, doesn't reclone/rebuild/reinstantiate languages that have been cloned/built/instantiated.
     """
-    from tree_sitter import Parser
-
-    clone_languages()
-    build_languages()
-    instantiate_languages()
+    ensure_languages(set(get_settings_dict()["installed_languages"]), get_build_path_files())
     if view := sublime.active_window().active_view():
-        if view.buffer().id() not in BUFFER_ID_TO_TREE:
-            parse_view(Parser(), view, get_view_text(view), publish_update=False)
+        if view.buffer_id() not in BUFFER_ID_TO_TREE:
+            s, change_count = get_view_text(view), view.change_count()
+            submit(PARSE_POOL, lambda: parse_view({}, view, s, change_count, publish_update=False))
 
 
 class TreeSitterUpdateTreeCommand(sublime_plugin.WindowCommand):
@@ -540,25 +745,26 @@ class TreeSitterEventListener(sublime_plugin.EventListener):
     to ensure client code can only access trees through `get_tree_dict`, which handles syntax changes on read.
     """
 
-    @property
-    def parser(self):
+    def __init__(self, *args, **kwargs):
+        self.parsers: dict[ScopeType, tuple[Language, Parser]] = {}
+        super().__init__(*args, **kwargs)
+
+    def handle_load(self, view: View, force: bool = True):
         """
-        This is a lazy loading hack. We can't get settings, which means we can't ensure `tree_sitter` is installed,
-        until the plugin is loaded and plugin classes have been instantiated.
+        If not `force`, skip parsing if the cached tree was parsed from the same buffer state by the time the job runs,
+        e.g. because both `on_activated` and `on_load` queued a parse.
         """
-        if not hasattr(self, "_parser"):
-            from tree_sitter import Parser
-
-            self._parser = Parser()
-        return self._parser
-
-    def handle_load(self, view: View):
-        s = get_view_text(view)
+        buffer_id = view.buffer_id()
+        s, change_count = get_view_text(view), view.change_count()
 
         def cb():
-            parse_view(self.parser, view, s)
+            if not force and (tree_dict := BUFFER_ID_TO_TREE.get(buffer_id)):
+                is_current = get_tree_source(buffer_id, tree_dict, change_count) is not None
+                if is_current and tree_dict["scope"] == check_scope(get_scope(view)):
+                    return
+            parse_view(self.parsers, view, s, change_count)
 
-        sublime.set_timeout_async(callback=cb, delay=0)
+        submit(PARSE_POOL, cb)
 
     def on_close(self, view: View):
         """
@@ -566,23 +772,23 @@ class TreeSitterEventListener(sublime_plugin.EventListener):
         buffer is "dead". This way clients don't accidentally use them.
         """
         if not view.clones():
-            BUFFER_ID_TO_TREE.pop(view.buffer().id(), None)
+            uncache_tree_dict(view.buffer_id())
 
     def on_activated(self, view: View):
         """
         Called when view gains focus. Ensures that we parse buffers on Sublime Text startup, where `on_load` callbacks
         not called. Testing shows that `on_text_changed` callbacks always enqueued after `on_activated` callbacks.
         """
-        if view.buffer().id() not in BUFFER_ID_TO_TREE:
-            self.handle_load(view)
+        if view.buffer_id() not in BUFFER_ID_TO_TREE:
+            self.handle_load(view, force=False)
 
     def on_load(self, view: View):
         """
         Testing suggests that `on_activated` always called before `on_load`. To be extra safe, we handle both of these
         events, and bail out if the other has already run for a given buffer.
         """
-        if view.buffer().id() not in BUFFER_ID_TO_TREE:
-            self.handle_load(view)
+        if view.buffer_id() not in BUFFER_ID_TO_TREE:
+            self.handle_load(view, force=False)
 
     def on_reload(self, view: View):
         self.handle_load(view)
@@ -595,8 +801,11 @@ class TreeSitterTextChangeListener(sublime_plugin.TextChangeListener):
     """
     Under the hood, ST synchronously puts async callbacks onto a queue. It asynchronously handles them in FIFO order in
     a separate thread. All async callbacks are handled by the same thread. Sublime source code suggests this, testing
-    with `time.sleep` confirms it. This ensures there are no races between "text change" events (almost always edit)
-    and "load" (always parse).
+    with `time.sleep` confirms it.
+
+    We don't parse on that thread though, because a slow parse would block every other plugin's async callbacks. Parses
+    are instead submitted to `PARSE_POOL`, which has one worker and is also FIFO. This ensures there are no races
+    between "text change" events (almost always edit) and "load" (always parse).
 
     When a text change occurs, we get its buffer and its syntax, look up the tree and metadata, and update/create the
     tree as necessary. Every listener instance is bound to a buffer, so we know in which buffer text changes occur.
@@ -606,20 +815,53 @@ class TreeSitterTextChangeListener(sublime_plugin.TextChangeListener):
         self.debounce_ms: int | None = None
         self.last_text_changed_s = 0
         self.debug = get_debug()
+        self.parsers: dict[ScopeType, tuple[Language, Parser]] = {}
+        # Buffer's change count after the last text change, or `None` if we may have missed text changes since then
+        self.change_count: int | None = None
+        # Text changes not yet handled by a parse job, with view text (if it was read), scope, and buffer's change count
+        # before and after each `on_text_changed`
+        self.pending: list[tuple[list[sublime.TextChange], str | None, ScopeType, int | None, int]] = []
+        self.pending_lock = Lock()
         super().__init__(*args, **kwargs)
 
-    @property
-    def parser(self):
-        if not hasattr(self, "_parser"):
-            from tree_sitter import Parser
+    def pop_pending(self):
+        """
+        Called in parse job. Returns all pending text changes, oldest first.
+        """
+        with self.pending_lock:
+            pending, self.pending = self.pending, []
+        return pending
 
-            self._parser = Parser()
-        return self._parser
+    def get_pending_edit(
+        self,
+        buffer_id: int,
+        tree_dict: TreeDict,
+        pending: list[tuple[list[sublime.TextChange], str | None, ScopeType, int | None, int]],
+    ) -> tuple[list[sublime.TextChange], bytearray] | None:
+        """
+        Called in parse job. Returns pending changes made since `tree_dict` was cached, concatenated, which can be
+        applied in order, and the tree's source, see `get_tree_source`. Returns `None` if the tree can't be edited.
+
+        Pending changes can be older than the cached tree, e.g. if `get_tree_dict` parsed view text after they were
+        queued. We skip those, but only if no text change is missing between the tree and the changes we apply.
+        """
+        for idx in range(len(pending) - 1, -1, -1):
+            prev_change_count = pending[idx][3]
+            if (buf := get_tree_source(buffer_id, tree_dict, prev_change_count)) is not None:
+                return [change for changes, *_ in pending[idx:] for change in changes], buf
+            if idx == 0 or prev_change_count != pending[idx - 1][4]:
+                break
+        return None
 
     def on_text_changed(self, changes: list[sublime.TextChange]):
         view = self.buffer.primary_view()
+        prev_change_count, change_count = self.change_count, view.change_count()
+        self.change_count = change_count
+
         scope = get_scope(view)
         if not (scope := check_scope(scope)):
+            # No cached tree can be edited with the next text change, so it reads view text and does a full parse
+            self.change_count = None
             return
 
         if self.debounce_ms is None:
@@ -628,47 +870,111 @@ class TreeSitterTextChangeListener(sublime_plugin.TextChangeListener):
             self.debounce_ms = round(language_name_to_debounce_ms.get(scope_to_language_name[scope], 0))
 
         buffer_id = self.buffer.id()
-        view_text = get_view_text(view)
-
         self.last_text_changed_s = time.monotonic()
         debounce_ms = self.debounce_ms or 0
 
-        def cb():
+        # If we'll probably edit a cached tree, we can derive new view text from it instead of reading it here. If a
+        # pending text change read view text, its job will probably do a full parse, which needs the latest view text
+        with self.pending_lock:
+            pending_view_text = any(s is not None for _, s, *_ in self.pending)
+        tree_dict = BUFFER_ID_TO_TREE.get(buffer_id)
+        can_edit = (
+            bool(tree_dict)
+            and debounce_ms == 0
+            and tree_dict["scope"] == scope
+            and prev_change_count is not None
+            and not pending_view_text
+        )
+        view_text = None if can_edit and not self.debug else get_view_text(view)
+
+        def cb(pending: list[tuple[list[sublime.TextChange], str | None, ScopeType, int | None, int]]):
             """
             Calling `get_view_text()` in `on_text_changed_async` doesn't always return view text right after the edit
             because it's async.
 
-            So, we handle the text change event in the main UI thread, get the new view text right there, and queue up
-            a "background job" with `set_timeout_async` to parse the new tree. This works because `set_timeout_async`
-            uses the same queue as the other `_async` methods.
+            So, we handle the text change event in the main UI thread, get the new view text right there if we need
+            it, and queue up a "background job" on `PARSE_POOL` to parse the new tree. If there's a debounce,
+            `set_timeout_async` waits before queueing the job.
+
+            Without a debounce, text changes that occur while a job is queued are added to `self.pending`, and handled
+            by that job, so a burst of text changes is applied with one parse instead of one parse per change. Its view
+            text and scope are those after the latest change.
+
+            The cached tree is only edited with text changes made since it was cached, at the change count right before
+            the first of them, see `get_pending_edit`. Otherwise it's missed text changes, and applying changes to it
+            would put it out of sync with the buffer, so we do a full parse instead. The buffer's change count is what
+            tells us this for sure; comparing e.g. text sizes would miss changes that don't alter size.
 
             Note that some language parsers are so slow they visibly affect UI thread performance. Setting a
             `debounce_ms` for these languages is recommended.
             """
+            _, view_text, scope, _, change_count = pending[-1]
             tree_dict = BUFFER_ID_TO_TREE.get(buffer_id)
-            scope_changed = bool(tree_dict) and tree_dict["scope"] != scope
+            pending_edit = None
+            if tree_dict and debounce_ms == 0 and tree_dict["scope"] == scope:
+                pending_edit = self.get_pending_edit(buffer_id, tree_dict, pending)
 
-            if not tree_dict or debounce_ms > 0 or scope_changed:
+            if not tree_dict or pending_edit is None:
                 dt_s = (time.monotonic() - self.last_text_changed_s) * 1000
                 if dt_s < debounce_ms:
                     return
-                tree = parse(self.parser, scope, s=view_text)
+                if view_text is None:
+                    # Cached tree can't be edited after all, e.g. it was removed or replaced after we queued this job,
+                    # so read view text in the main thread and parse
+                    sublime.set_timeout(lambda: self.handle_missing_tree(view))
+                    return
+                b = view_text.encode()
+                tree, buf, new_view_text = parse(get_parser(self.parsers, scope), s=b), bytearray(b), view_text
             else:
-                tree = edit(
-                    self.parser,
-                    scope,
-                    changes,
-                    tree_dict["tree"],
-                    s=tree_dict["s"],
-                    new_s=view_text,
-                    debug=self.debug,
-                )
-
-            BUFFER_ID_TO_TREE[buffer_id] = make_tree_dict(tree, view_text, scope)
-            trim_cached_trees()
+                changes, buf = pending_edit
+                try:
+                    tree, buf, new_view_text = edit(
+                        get_parser(self.parsers, scope),
+                        changes,
+                        tree_dict["tree"],
+                        s=tree_dict["s"],
+                        buf=buf,
+                        new_s=view_text,
+                        debug=self.debug,
+                    )
+                except Exception:
+                    # `edit` mutates cached tree and source, so they may already be out of sync with `s`
+                    uncache_tree_dict(buffer_id)
+                    raise
+
+            cache_tree_dict(buffer_id, make_tree_dict(tree, new_view_text, scope), buf, change_count)
             publish_tree_update(view.window(), buffer_id=buffer_id, scope=scope)
 
-        sublime.set_timeout_async(callback=cb, delay=debounce_ms + 1 if debounce_ms > 0 else 0)
+        entry = (changes, view_text, scope, prev_change_count, change_count)
+        if debounce_ms > 0:
+            sublime.set_timeout_async(callback=lambda: submit(PARSE_POOL, lambda: cb([entry])), delay=debounce_ms + 1)
+            return
+
+        with self.pending_lock:
+            self.pending.append(entry)
+            should_submit = len(self.pending) == 1
+        if should_submit:
+            submit(PARSE_POOL, lambda: cb(self.pop_pending()))
+
+    def handle_missing_tree(self, view: View):
+        """
+        Called in the main thread. Any text changes made after this are queued after the parse, so they edit its tree.
+        """
+        s, change_count = get_view_text(view), view.change_count()
+        submit(PARSE_POOL, lambda: parse_view(self.parsers, view, s, change_count))
+
+    def on_revert(self):
+        """
+        Reverting and reloading replace buffer text without reporting text changes, so the next text change does a full
+        parse from view text.
+        """
+        self.change_count = None
+
+    def on_reload(self):
+        """
+        See `on_revert`.
+        """
+        self.change_count = None
 
 
 #
@@ -686,9 +992,9 @@ def remove_language(language: str):
     - Remove `Language` instance from `SCOPE_TO_LANGUAGE`
     """
     if get_settings_dict().get("python_path"):
-        repo_dict = get_language_name_to_repo().get(language)
-        if repo_dict:
-            _, repo = repo_dict["repo"].split("/")
+        repo_entry = get_language_name_to_repo().get(language)
+        if repo_entry:
+            _, repo = repo_entry.repo.split("/")
             try:
                 rmtree(BUILD_PATH / repo)
             except Exception as e:
@@ -702,6 +1008,7 @@ def remove_language(language: str):
 
     for scope in get_language_name_to_scopes().get(language, []):
         SCOPE_TO_LANGUAGE.pop(scope, None)
+    refresh_active_scopes()
 
 
 class TreeSitterSelectLanguageMixin:
@@ -749,13 +1056,13 @@ class TreeSitterInstallLanguageCommand(TreeSitterSelectLanguageMixin, sublime_pl
         language = self.languages[idx]
 
         settings = get_settings()
-        languages = get_settings_dict()["installed_languages"]
+        languages = list(get_settings_dict()["installed_languages"])
         if language not in languages:
             languages.append(language)
 
         settings.set("installed_languages", languages)
         sublime.save_settings(SETTINGS_FILENAME)
-        Thread(target=install_languages).start()
+        submit(MAINTENANCE_POOL, install_languages)
 
 
 class TreeSitterRemoveLanguageCommand(TreeSitterSelectLanguageMixin, sublime_plugin.WindowCommand):
@@ -771,13 +1078,13 @@ class TreeSitterRemoveLanguageCommand(TreeSitterSelectLanguageMixin, sublime_plu
         language = self.languages[idx]
 
         settings = get_settings()
-        languages = get_settings_dict()["installed_languages"]
+        languages = list(get_settings_dict()["installed_languages"])
         while language in languages:
             languages.remove(language)
 
         settings.set("installed_languages", languages)
         sublime.save_settings(SETTINGS_FILENAME)
-        Thread(target=lambda lang=language: remove_language(lang)).start()
+        submit(MAINTENANCE_POOL, lambda: remove_language(language))
 
 
 class TreeSitterUpdateLanguageCommand(TreeSitterSelectLanguageMixin, sublime_plugin.WindowCommand):
@@ -796,4 +1103,4 @@ class TreeSitterUpdateLanguageCommand(TreeSitterSelectLanguageMixin, sublime_plu
             remove_language(language)
             install_languages()
 
-        Thread(target=remove_and_reinstall_language).start()
+        submit(MAINTENANCE_POOL, remove_and_reinstall_language)
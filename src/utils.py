@@ -1,8 +1,10 @@
 from __future__ import annotations
 
 import sys
+from functools import lru_cache
 from pathlib import Path
-from typing import TYPE_CHECKING, Literal, TypedDict, TypeVar, cast
+from types import MappingProxyType
+from typing import TYPE_CHECKING, Literal, Mapping, NamedTuple, TypedDict, TypeVar, cast
 
 import sublime
 
@@ -110,61 +112,65 @@ ScopeType = Literal[
     "source.hack",
 ]
 
-LANGUAGE_NAME_TO_SCOPES: dict[str, list[ScopeType]] = {
-    "python": ["source.python"],
-    "typescript": ["source.ts"],
-    "tsx": ["source.tsx"],
-    "javascript": [
+LANGUAGE_NAME_TO_SCOPES: dict[str, tuple[ScopeType, ...]] = {
+    "python": ("source.python",),
+    "typescript": ("source.ts",),
+    "tsx": ("source.tsx",),
+    "javascript": (
         "source.js",
         "source.jsx",
-    ],
-    "css": ["source.css"],
-    "scss": ["source.scss"],
-    "go": ["source.go"],
-    "rust": ["source.rust"],
-    "lua": ["source.lua"],
-    "ruby": ["source.ruby"],
-    "java": ["source.java"],
-    "php": ["source.php"],
-    "zig": ["source.zig"],
-    "c": ["source.c"],
-    "cpp": ["source.c++"],
-    "c_sharp": ["source.cs"],
-    "scala": ["source.scala"],
-    "kotlin": ["source.Kotlin"],
-    "julia": ["source.julia"],
-    "haskell": ["source.haskell"],
-    "clojure": ["source.clojure"],
-    "elixir": ["source.elixir"],
-    "toml": ["source.toml"],
-    "yaml": ["source.yaml"],
-    "json": ["source.json"],
-    "bash": ["source.shell"],
-    "query": ["source.scheme"],
-    "vue": ["text.html.vue"],
-    "svelte": ["text.html.svelte"],
-    "sql": ["source.sql"],
-    "html": [
+    ),
+    "css": ("source.css",),
+    "scss": ("source.scss",),
+    "go": ("source.go",),
+    "rust": ("source.rust",),
+    "lua": ("source.lua",),
+    "ruby": ("source.ruby",),
+    "java": ("source.java",),
+    "php": ("source.php",),
+    "zig": ("source.zig",),
+    "c": ("source.c",),
+    "cpp": ("source.c++",),
+    "c_sharp": ("source.cs",),
+    "scala": ("source.scala",),
+    "kotlin": ("source.Kotlin",),
+    "julia": ("source.julia",),
+    "haskell": ("source.haskell",),
+    "clojure": ("source.clojure",),
+    "elixir": ("source.elixir",),
+    "toml": ("source.toml",),
+    "yaml": ("source.yaml",),
+    "json": ("source.json",),
+    "bash": ("source.shell",),
+    "query": ("source.scheme",),
+    "vue": ("text.html.vue",),
+    "svelte": ("text.html.svelte",),
+    "sql": ("source.sql",),
+    "html": (
         "text.html.basic",
         "text.xml",
-    ],
-    "markdown": ["text.html.markdown"],
-    "erlang": ["source.erlang"],
-    "make": ["source.makefile"],
-    "dockerfile": ["source.dockerfile"],
-    "elm": ["source.elm"],
-    "perl": ["source.perl"],
-    "objc": ["source.objc"],
-    "r": ["source.r"],
-    "rst": ["text.restructuredtext"],
-    "ocaml": ["source.ocaml"],
-    "regex": ["source.regexp"],
-    "latex": ["text.tex.latex"],
-    "hcl": ["source.hcl"],
-    "terraform": ["source.terraform"],
-    "hack": ["source.hack"],
+    ),
+    "markdown": ("text.html.markdown",),
+    "erlang": ("source.erlang",),
+    "make": ("source.makefile",),
+    "dockerfile": ("source.dockerfile",),
+    "elm": ("source.elm",),
+    "perl": ("source.perl",),
+    "objc": ("source.objc",),
+    "r": ("source.r",),
+    "rst": ("text.restructuredtext",),
+    "ocaml": ("source.ocaml",),
+    "regex": ("source.regexp",),
+    "latex": ("text.tex.latex",),
+    "hcl": ("source.hcl",),
+    "terraform": ("source.terraform",),
+    "hack": ("source.hack",),
 }
 
+SCOPE_TO_LANGUAGE_NAME: Mapping[ScopeType, str] = MappingProxyType(
+    {scope: name for name, scopes in LANGUAGE_NAME_TO_SCOPES.items() for scope in scopes}
+)
+
 """
 Notes on languages
 
@@ -186,53 +192,64 @@ class RepoDict(TypedDict):
     parser_path: NotRequired[str]
 
 
-LANGUAGE_NAME_TO_REPO: dict[str, RepoDict] = {
-    "python": {"repo": "tree-sitter/tree-sitter-python"},
-    "typescript": {"repo": "tree-sitter/tree-sitter-typescript", "parser_path": "typescript"},
-    "tsx": {"repo": "tree-sitter/tree-sitter-typescript", "parser_path": "tsx"},
-    "javascript": {"repo": "tree-sitter/tree-sitter-javascript"},
-    "css": {"repo": "tree-sitter/tree-sitter-css"},
-    "scss": {"repo": "serenadeai/tree-sitter-scss"},
-    "go": {"repo": "tree-sitter/tree-sitter-go"},
-    "rust": {"repo": "tree-sitter/tree-sitter-rust"},
-    "lua": {"repo": "MunifTanjim/tree-sitter-lua"},
-    "ruby": {"repo": "tree-sitter/tree-sitter-ruby"},
-    "java": {"repo": "tree-sitter/tree-sitter-java"},
-    "php": {"repo": "tree-sitter/tree-sitter-php"},
-    "zig": {"repo": "maxxnino/tree-sitter-zig"},
-    "c": {"repo": "tree-sitter/tree-sitter-c"},
-    "cpp": {"repo": "tree-sitter/tree-sitter-cpp"},
-    "c_sharp": {"repo": "tree-sitter/tree-sitter-c-sharp"},
-    "scala": {"repo": "tree-sitter/tree-sitter-scala"},
-    "toml": {"repo": "ikatyang/tree-sitter-toml"},
-    "yaml": {"repo": "ikatyang/tree-sitter-yaml"},
-    "json": {"repo": "tree-sitter/tree-sitter-json"},
-    "bash": {"repo": "tree-sitter/tree-sitter-bash"},
-    "vue": {"repo": "ikatyang/tree-sitter-vue"},
-    "svelte": {"repo": "Himujjal/tree-sitter-svelte"},
-    "html": {"repo": "tree-sitter/tree-sitter-html"},
-    "markdown": {"repo": "ikatyang/tree-sitter-markdown"},
-    "kotlin": {"repo": "fwcd/tree-sitter-kotlin"},
-    "julia": {"repo": "tree-sitter/tree-sitter-julia"},
-    "haskell": {"repo": "tree-sitter/tree-sitter-haskell"},
-    "clojure": {"repo": "sogaiu/tree-sitter-clojure"},
-    "elixir": {"repo": "elixir-lang/tree-sitter-elixir"},
-    "query": {"repo": "nvim-treesitter/tree-sitter-query"},
-    "sql": {"repo": "DerekStride/tree-sitter-sql", "branch": "gh-pages"},
-    "ocaml": {"repo": "tree-sitter/tree-sitter-ocaml", "parser_path": "ocaml"},
-    "elm": {"repo": "elm-tooling/tree-sitter-elm"},
-    "r": {"repo": "r-lib/tree-sitter-r"},
-    "dockerfile": {"repo": "camdencheek/tree-sitter-dockerfile"},
-    "erlang": {"repo": "WhatsApp/tree-sitter-erlang"},
-    "objc": {"repo": "jiyee/tree-sitter-objc"},
-    "perl": {"repo": "ganezdragon/tree-sitter-perl"},
-    "regex": {"repo": "tree-sitter/tree-sitter-regex"},
-    "make": {"repo": "alemuller/tree-sitter-make"},
-    "rst": {"repo": "stsewd/tree-sitter-rst"},
-    "latex": {"repo": "latex-lsp/tree-sitter-latex"},
-    "hcl": {"repo": "MichaHoffmann/tree-sitter-hcl"},
-    "terraform": {"repo": "MichaHoffmann/tree-sitter-hcl", "parser_path": "dialects/terraform"},
-    "hack": {"repo": "slackhq/tree-sitter-hack"},
+class RepoEntry(NamedTuple):
+    """
+    Same fields as `RepoDict`, which is how repos are specified in settings. Built-in repos are `RepoEntry`s, and
+    `get_language_name_to_repo` converts repos from settings to `RepoEntry`s.
+    """
+
+    repo: str
+    branch: str = ""
+    parser_path: str = ""
+
+
+LANGUAGE_NAME_TO_REPO: dict[str, RepoEntry] = {
+    "python": RepoEntry("tree-sitter/tree-sitter-python"),
+    "typescript": RepoEntry("tree-sitter/tree-sitter-typescript", parser_path="typescript"),
+    "tsx": RepoEntry("tree-sitter/tree-sitter-typescript", parser_path="tsx"),
+    "javascript": RepoEntry("tree-sitter/tree-sitter-javascript"),
+    "css": RepoEntry("tree-sitter/tree-sitter-css"),
+    "scss": RepoEntry("serenadeai/tree-sitter-scss"),
+    "go": RepoEntry("tree-sitter/tree-sitter-go"),
+    "rust": RepoEntry("tree-sitter/tree-sitter-rust"),
+    "lua": RepoEntry("MunifTanjim/tree-sitter-lua"),
+    "ruby": RepoEntry("tree-sitter/tree-sitter-ruby"),
+    "java": RepoEntry("tree-sitter/tree-sitter-java"),
+    "php": RepoEntry("tree-sitter/tree-sitter-php"),
+    "zig": RepoEntry("maxxnino/tree-sitter-zig"),
+    "c": RepoEntry("tree-sitter/tree-sitter-c"),
+    "cpp": RepoEntry("tree-sitter/tree-sitter-cpp"),
+    "c_sharp": RepoEntry("tree-sitter/tree-sitter-c-sharp"),
+    "scala": RepoEntry("tree-sitter/tree-sitter-scala"),
+    "toml": RepoEntry("ikatyang/tree-sitter-toml"),
+    "yaml": RepoEntry("ikatyang/tree-sitter-yaml"),
+    "json": RepoEntry("tree-sitter/tree-sitter-json"),
+    "bash": RepoEntry("tree-sitter/tree-sitter-bash"),
+    "vue": RepoEntry("ikatyang/tree-sitter-vue"),
+    "svelte": RepoEntry("Himujjal/tree-sitter-svelte"),
+    "html": RepoEntry("tree-sitter/tree-sitter-html"),
+    "markdown": RepoEntry("ikatyang/tree-sitter-markdown"),
+    "kotlin": RepoEntry("fwcd/tree-sitter-kotlin"),
+    "julia": RepoEntry("tree-sitter/tree-sitter-julia"),
+    "haskell": RepoEntry("tree-sitter/tree-sitter-haskell"),
+    "clojure": RepoEntry("sogaiu/tree-sitter-clojure"),
+    "elixir": RepoEntry("elixir-lang/tree-sitter-elixir"),
+    "query": RepoEntry("nvim-treesitter/tree-sitter-query"),
+    "sql": RepoEntry("DerekStride/tree-sitter-sql", branch="gh-pages"),
+    "ocaml": RepoEntry("tree-sitter/tree-sitter-ocaml", parser_path="ocaml"),
+    "elm": RepoEntry("elm-tooling/tree-sitter-elm"),
+    "r": RepoEntry("r-lib/tree-sitter-r"),
+    "dockerfile": RepoEntry("camdencheek/tree-sitter-dockerfile"),
+    "erlang": RepoEntry("WhatsApp/tree-sitter-erlang"),
+    "objc": RepoEntry("jiyee/tree-sitter-objc"),
+    "perl": RepoEntry("ganezdragon/tree-sitter-perl"),
+    "regex": RepoEntry("tree-sitter/tree-sitter-regex"),
+    "make": RepoEntry("alemuller/tree-sitter-make"),
+    "rst": RepoEntry("stsewd/tree-sitter-rst"),
+    "latex": RepoEntry("latex-lsp/tree-sitter-latex"),
+    "hcl": RepoEntry("MichaHoffmann/tree-sitter-hcl"),
+    "terraform": RepoEntry("MichaHoffmann/tree-sitter-hcl", parser_path="dialects/terraform"),
+    "hack": RepoEntry("slackhq/tree-sitter-hack"),
 }
 
 
@@ -249,45 +266,100 @@ def get_debug():
     return get_settings_dict().get("debug") or False
 
 
+# Cached result of `get_settings().to_dict()`, which materializes all settings every time it's called
+_settings_cache: SettingsDict | None = None
+
+
 def get_settings_dict(settings: sublime.Settings | None = None):
-    return cast(SettingsDict, (settings or get_settings()).to_dict())
+    """
+    Returns cached settings dict, unless `settings` is passed. Treat it as read-only, and call
+    `invalidate_settings_cache` when settings change.
+    """
+    global _settings_cache
+
+    if settings is not None:
+        return cast(SettingsDict, settings.to_dict())
+    if _settings_cache is None:
+        _settings_cache = cast(SettingsDict, get_settings().to_dict())
+    return _settings_cache
+
+
+def invalidate_settings_cache():
+    """
+    Clear settings dict, and lookup tables derived from it. Called in settings `on_change` callback.
+    """
+    global _settings_cache
+
+    _settings_cache = None
+    get_language_name_to_scopes.cache_clear()
+    get_scope_to_language_name.cache_clear()
+    get_language_name_to_repo.cache_clear()
+    get_language_name_to_parser_path.cache_clear()
 
 
+@lru_cache(maxsize=None)
 def get_language_name_to_scopes():
+    """
+    Returns a read-only mapping, because it's cached and shared by all callers.
+    """
     settings_d = get_settings_dict().get("language_name_to_scopes") or {}
-    return {**LANGUAGE_NAME_TO_SCOPES, **settings_d}
+    return MappingProxyType({**LANGUAGE_NAME_TO_SCOPES, **settings_d})
 
 
 def get_language_name_to_debounce_ms():
     return get_settings_dict().get("language_name_to_debounce_ms") or {}
 
 
-def get_scope_to_language_name():
+@lru_cache(maxsize=None)
+def get_scope_to_language_name() -> Mapping[ScopeType, str]:
+    """
+    Returns precomputed `SCOPE_TO_LANGUAGE_NAME`, unless user overrides `language_name_to_scopes` in settings. Either
+    way it's a read-only mapping, because it's cached and shared by all callers.
+    """
+    if not get_settings_dict().get("language_name_to_scopes"):
+        return SCOPE_TO_LANGUAGE_NAME
+
     scope_to_language_name: dict[ScopeType, str] = {}
 
     language_name_to_scopes = get_language_name_to_scopes()
     for language_name, scopes in language_name_to_scopes.items():
         for scope in scopes:
             scope_to_language_name[scope] = language_name
-    return scope_to_language_name
+    return MappingProxyType(scope_to_language_name)
 
 
+@lru_cache(maxsize=None)
 def get_language_name_to_repo():
+    """
+    Returns a read-only mapping, because it's cached and shared by all callers.
+    """
     settings_d = get_settings_dict().get("language_name_to_repo") or {}
-    return {**LANGUAGE_NAME_TO_REPO, **settings_d}
-
-
+    return MappingProxyType(
+        {
+            **LANGUAGE_NAME_TO_REPO,
+            **{
+                name: RepoEntry(d["repo"], d.get("branch", ""), d.get("parser_path", ""))
+                for name, d in settings_d.items()
+            },
+        }
+    )
+
+
+@lru_cache(maxsize=None)
 def get_language_name_to_parser_path():
+    """
+    Returns a read-only mapping, because it's cached and shared by all callers.
+    """
     language_name_to_parser_path: dict[str, str] = {}
     language_name_to_repo = get_language_name_to_repo()
 
-    for name, repo_dict in language_name_to_repo.items():
-        _, repo = repo_dict["repo"].split("/")
-        if parser_path := repo_dict.get("parser_path"):
+    for name, repo_entry in language_name_to_repo.items():
+        _, repo = repo_entry.repo.split("/")
+        if parser_path := repo_entry.parser_path:
             language_name_to_parser_path[name] = str(Path(repo) / Path(parser_path))
         else:
             language_name_to_parser_path[name] = repo
-    return language_name_to_parser_path
+    return MappingProxyType(language_name_to_parser_path)
 
 
 def get_queries_path():